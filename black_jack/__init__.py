@@ -0,0 +1,42 @@
+"""
+Console game Black Jack.
+
+Importing the package loads only the game core and the console interface. Heavy subsystems
+(simulation, load harness) are imported on first access, e.g. black_jack.simulation or
+black_jack.simulate(...), so a quick game or a test run does not pay for them.
+"""
+import importlib
+
+from black_jack.core import (
+    HEARTS, DIAMONDS, SPADES, CLUBS,
+    UNKNOWN, PLAYER_WINS, DEALER_WINS, DRAW,
+    global_card_suits, global_card_ranks, global_card_values,
+    Card, Deck, Hand, Player, GameTable,
+)
+from black_jack.cli import (
+    PROMPT_NAME, PROMPT_MONEY, PROMPT_BET, PROMPT_CHOICE, PROMPT_CONTINUE, PROMPT_PLAY_AGAIN,
+    main,
+)
+
+
+# Submodules loaded on first access and the names they provide.
+
+_lazy_submodules = ('simulation', 'load_harness')
+_lazy_attributes = {
+    'simulate': 'simulation',
+    'simulate_parallel': 'simulation',
+    'run_load_test': 'load_harness',
+}
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name in _lazy_attributes:
+        module = importlib.import_module(f'{__name__}.{_lazy_attributes[name]}')
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_submodules) | set(_lazy_attributes))
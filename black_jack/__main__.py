@@ -0,0 +1,4 @@
+from black_jack.cli import main
+
+
+main()
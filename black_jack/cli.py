@@ -0,0 +1,195 @@
+import random
+
+from black_jack.core import Deck, Player, GameTable, DEALER_WINS, PLAYER_WINS, DRAW
+
+
+# Prompts of the console interface.
+
+PROMPT_NAME = 'С кем имею честь играть? '
+PROMPT_MONEY = 'Сколько у Вас наличных? '
+PROMPT_BET = 'Ваша ставка, любезнейший: '
+PROMPT_CHOICE = ('[1] - Взять ещё одну карту.\n'
+                 '[2] - Удвоить ставку и взять карту.\n'
+                 '[ENTER] - Передать ход дилеру.\n'
+                 'Ваш выбор: ')
+PROMPT_CONTINUE = 'Для продолжения нажмите [ENTER]...'
+PROMPT_PLAY_AGAIN = 'Хотите испытать удачу снова?\n[ENTER] - Да\n[No] - Нет\n'
+
+
+def main(input_func=input, print_func=print):
+    """
+    Run an interactive game session.
+
+    All console I/O goes through input_func and print_func, so a session can be driven by scripted answers.
+    """
+
+    # Приветствие и начало игры.
+
+    print_func('\n*** Добро пожаловать в игру "Black Jack"! ***\n')
+    print_func('Я - электронный дилер для игры в "21", также известную как "Black Jack".')
+    bank = random.randint(500, 2500)
+    print_func(f'Сегодня в банке ${str(bank)}.\n')
+
+    name = input_func(PROMPT_NAME)
+    money = int(input_func(PROMPT_MONEY))
+    if money <= 0:
+        print_func('Приношу свои извинения, но у нас играют только на деньги. '
+                   'Охрана, покажите, пожалуйста, этому человеку, где у нас дверь.')
+        return
+
+    player = Player(name, money)
+    dealer = Player('Дилер', bank)
+    table = GameTable(dealer, player, print_func=print_func)
+
+
+    # Начинаем играть, пока у игрока или у дилера остаются деньги.
+
+    while player.money > 0 and dealer.money > 0:
+
+
+        # Очистить игровой стол, сбросить карты с рук и взять новую колоду карт.
+        table.reset_game_table()
+        player.reset_hand()
+        dealer.reset_hand()
+        deck = Deck(deck_type=52)
+
+
+        # Принять ставку
+
+        for i in range(3):
+            player_bet = int(input_func(PROMPT_BET))
+            if player_bet <= 0:
+                print_func('Ваши шансы не настолько малы!')
+            elif player_bet > player.money:
+                print_func('Вы о себе слишком высокого мнения!')
+            elif player_bet > dealer.money:
+                print_func('Позвольте! Вы хотите оставить меня без штанов?')
+            else:
+                table.make_a_bet(player_bet)
+                break
+        else:
+            print_func('Переговоры зашли в тупик... Охрана!..')
+            break
+
+
+        # Раздать по две карты дилеру и игроку. Одна карта дилера остаётся закрытой.
+
+        for i in range(2):
+            player.hand.take_card(deck.get_card())
+            player.hand.open_card()
+
+        for i in range(2):
+            dealer.hand.take_card(deck.get_card())
+            if i == 0:
+                dealer.hand.open_card()
+
+
+        # Ход игрока.
+
+        while player.hand.count_values() <= 21:
+
+
+            # Показать игровой стол.
+
+            table.print_game_table()
+
+
+            # Доступно несколько действий.
+
+            print_func('Весь расклад на столе. Что планируете делать?')
+            choice = input_func(PROMPT_CHOICE)
+
+            if choice in ['1', '2']:  # Игрок берёт ещё одну карту.
+                player.hand.take_card(deck.get_card())
+                player.hand.open_card()
+
+                if choice == '2': # Игрок решил удвоить ставку.
+                    try:
+                        table.make_a_bet(int(table.bank / 2))
+                    except ValueError as message:
+                        print_func(message)
+
+            else:  # Игрок завершает все свои действия и передаёт ход дилеру.
+                break
+
+
+        # Ход дилера
+
+        if player.hand.count_values() > 21:
+            print_func('Похоже, Вы перебрали!')
+        else:
+
+            # Дилер открывает карту.
+
+            dealer.hand.open_card()
+
+
+            # Дилер обязан брать карты, пока сумма его руки меньше 17.
+
+            while dealer.hand.count_values() < 17:
+
+                # Показать игровой стол.
+
+                table.print_game_table()
+                #input('Дилер собирается сделать ход. Нажмите [ENTER], чтобы продолжить...')
+
+                # Дилер выбирает действие.
+
+                if dealer.hand.count_values() < 17:
+                    print_func('Дилер решил взять ещё одну карту...')
+                    dealer.hand.take_card(deck.get_card())
+                    dealer.hand.open_card()
+                else:
+                    print_func('Дилер завершает ход.')
+
+                input_func(PROMPT_CONTINUE)
+                table.clear_screen()
+
+
+        # Проверка результата и подведение итогов партии.
+
+        table.check_game_status()
+
+        if table.game_status == DEALER_WINS:    # Игрок проиграл партию.
+            table.reward_winner()
+            table.print_game_table()
+            print_func('\n' + '*'*80)
+            print_func(f'*\tПростите, {player.name}, но удача на моей стороне.')
+            print_func('*'*80 + '\n')
+
+        elif table.game_status == PLAYER_WINS:   # Дилер проиграл партию.
+            table.reward_winner()
+            table.print_game_table()
+            print_func('\n' + '*'*80)
+            print_func('*\tПоздравляю! Вы победили.')
+            print_func('*'*80 + '\n')
+        elif table.game_status == DRAW:   # Ничья.
+            table.reward_winner()
+            table.print_game_table()
+            print_func('\n' + '*'*80)
+            print_func('*\tВ этот раз ничья! Каждый останется при своих.')
+            print_func('*'*80 + '\n')
+        else:   # Непредвиденная ошибка.
+            table.reward_winner()
+            table.print_game_table()
+
+
+        # Преложить сыграть ещё раз.
+
+        if player.money > 0 and dealer.money > 0:
+            choice = input_func(PROMPT_PLAY_AGAIN)
+            if choice.lower() in ['no', 'n', 'нет', 'н']:
+                break
+        else:
+            print_func('Кажется, кто-то остался без штанов!')
+
+
+    # Прощаемся с игроком.
+
+    if player.money <= 0:
+        print_func(f'Ну вот и всё, уважаемый {player.name}! '
+              f'Ваши карманы пусты, а это значит, что мы с Вами встретимся в следующий раз!')
+    else:
+        print_func(f'Ну вот и всё, уважаемый {player.name}! Надеюсь, в следующий раз удача будет на моей стороне.')
+
+    print_func('\n*** До новых встречь в игре "Black Jack"! ***\n')
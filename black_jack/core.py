@@ -0,0 +1,239 @@
+import random
+
+
+# Unicode symbols for card suits.
+
+HEARTS = chr(9829)
+DIAMONDS = chr(9824)
+SPADES = chr(9830)
+CLUBS = chr(9827)
+
+
+# Game statuses.
+
+UNKNOWN = 0
+PLAYER_WINS = 1
+DEALER_WINS = 2
+DRAW = 3
+
+
+# Describe every card with it's value in Black Jack game.
+
+global_card_suits = (HEARTS, DIAMONDS, SPADES, CLUBS)
+global_card_ranks = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
+global_card_values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
+                      'Jack': 10, 'Queen': 10, 'King': 10, 'Ace': 11}
+
+
+class Card:
+    def __init__(self, suit, rank):
+        self.suit = suit
+        self.rank = rank
+        self.value = global_card_values[rank]
+
+    def __str__(self):
+        return f'{self.rank} {self.suit}'
+
+    def __eq__(self, other):
+        if self.suit == other.suit and self.rank == other.rank:
+            return True
+        else:
+            return False
+
+    def get_value(self):
+        return self.value
+
+    def toggle_ace_value(self):
+        if self.rank == 'Ace' and self.value == 11:
+            self.value = 1
+
+
+class Deck:
+    def __init__(self, deck_type=52):
+        self.cards = []
+
+        if deck_type == 0:
+            return
+        elif deck_type == 36:
+            for suit in global_card_suits:
+                for rank in global_card_ranks[4:]:
+                    self.cards.append(Card(suit, rank))
+        elif deck_type == 52:
+            for suit in global_card_suits:
+                for rank in global_card_ranks:
+                    self.cards.append(Card(suit, rank))
+        else:
+            raise ValueError(f'Deck with deck_type={deck_type} cards is not supported.')
+
+        self.shuffle()
+
+    def __len__(self):
+        return len(self.cards)
+
+    def shuffle(self):
+        random.shuffle(self.cards)
+
+    def get_card(self):
+        return self.cards.pop()
+
+    def __iter__(self):
+        self.iter_pos = 0
+        return self
+
+    def __next__(self):
+        if self.iter_pos >= len(self.cards):
+            raise StopIteration
+        else:
+            self.iter_pos += 1
+            return self.cards[self.iter_pos-1]
+
+
+class Hand:
+    def __init__(self):
+        self.cards = []
+        self.cards_closed = []
+
+    def __len__(self):
+        return len(self.cards) + len(self.cards_closed)
+
+    def count_values(self):
+        value = 0
+        high_aces = 0
+
+        for card in self.cards:
+            if card.rank == 'Ace' and card.value == 11:
+                high_aces += 1
+            value += card.get_value()
+
+        while value > 21 and high_aces > 0:
+            for card in self.cards:
+                if card.rank == 'Ace' and card.value == 11:
+                    card.toggle_ace_value()
+                    value -= 10
+                    high_aces -= 1
+                    break
+
+        return value
+
+    def open_card(self):
+        if self.cards_closed:
+            card = self.cards_closed.pop(0)
+            self.cards.append(card)
+
+    def take_card(self, card):
+        self.cards_closed.append(card)
+
+    def __str__(self):
+        text = '(' + str(self.count_values()) + '): '
+        for card in self.cards:
+            text += '[' + str(card) + '] '
+        for _ in self.cards_closed:
+            text += '[#] '
+        return text
+
+    def __iter__(self):
+        self._iter_pos = 0
+        return self
+
+    def __next__(self):
+        if self._iter_pos < len(self.cards):
+            self._iter_pos += 1
+            return self.cards[self._iter_pos - 1]
+        else:
+            raise StopIteration
+
+
+class Player:
+    def __init__(self, name, money):
+        self.name = name
+        self.money = money
+        self.hand = Hand()
+
+    def __str__(self):
+        return self.name + ' ( $ ' + self.money + ' )'
+
+    def reset_hand(self):
+        self.hand = Hand()
+
+
+class GameTable:
+    def __init__(self, dealer_object: '<class Player> object', player_object: '<class Player> object',
+                 print_func=print):
+        self.dealer = dealer_object
+        self.player = player_object
+        self.bank = 0
+        self.game_status = UNKNOWN
+        self.print_func = print_func
+
+    def make_a_bet(self, bet_amount: int):
+        if self.player.money < bet_amount:
+            raise ValueError('Вы не можете поставить больше, чем у Вас есть!')
+        elif self.dealer.money < bet_amount:
+            raise ValueError('Я в долг не играю!')
+        elif bet_amount < 0:
+            raise ValueError('Держи вора!')
+        elif bet_amount == 0:
+            raise ValueError('Бесплатно только кошки родятся!')
+        else:
+            self.player.money -= bet_amount
+            self.dealer.money -= bet_amount
+            self.bank += bet_amount * 2
+
+    def reward_winner(self):
+        if self.game_status == PLAYER_WINS:
+            self.player.money += self.bank
+        elif self.game_status == DEALER_WINS:
+            self.dealer.money += self.bank
+        elif self.game_status == DRAW:
+            self.player.money += int(self.bank / 2)
+            self.dealer.money += int(self.bank / 2)
+        else:
+            raise ValueError('Результат игры неопределён! Так кому же достанется банк?')
+        self.bank = 0
+
+    def check_game_status(self):
+        player_score = self.player.hand.count_values()
+        dealer_score = self.dealer.hand.count_values()
+
+        if player_score > 21 or (21 >= dealer_score > player_score):
+            self.game_status = DEALER_WINS
+        elif dealer_score > 21 or (21 >= player_score > dealer_score):
+            self.game_status = PLAYER_WINS
+        elif player_score == dealer_score <= 21:
+            self.game_status = DRAW
+        else:
+            self.game_status = UNKNOWN
+        return self.game_status
+
+    def reset_game_table(self):
+        self.bank = 0
+        self.game_status = UNKNOWN
+
+    def clear_screen(self):
+        self.print_func('\n' * 100)
+
+    def print_game_table(self, clear_screen=True):
+        if clear_screen:
+            self.clear_screen()
+
+        self.print_func('+' + '-'*78 + '+')
+
+        self.print_func('|{:78}|'.format(' '))
+        text = ' Игрок ' + self.dealer.name + ' ($' + str(self.dealer.money) + ')'
+        self.print_func(f'|{text:78}|')
+        self.print_func('|{:78}|'.format(' '))
+        text = ' Карты игрока: ' + str(self.dealer.hand)
+        self.print_func(f'|{text:78}|')
+        self.print_func('|{:78}|'.format(' '))
+
+        self.print_func('+{:-^78}+'.format(' Банк $' + str(self.bank) + ' '))
+
+        self.print_func('|{:78}|'.format(' '))
+        text = ' Игрок ' + self.player.name + ' ($' + str(self.player.money) + ')'
+        self.print_func(f'|{text:78}|')
+        self.print_func('|{:78}|'.format(' '))
+        text = ' Карты игрока: ' + str(self.player.hand)
+        self.print_func(f'|{text:78}|')
+        self.print_func('|{:78}|'.format(' '))
+
+        self.print_func('+{:-^78}+'.format('-'))
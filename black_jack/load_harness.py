@@ -0,0 +1,155 @@
+"""
+Load harness for the console interface of Black Jack game.
+
+Runs complete game sessions through black_jack.main() with scripted answers instead of a keyboard
+and measures how long the game takes to get from one prompt to the next, as well as the total
+session throughput. Everything the game prints is sent to a null sink.
+
+Usage:
+    python -m black_jack.load_harness --sessions 5000 --seed 1
+"""
+import argparse
+import itertools
+import random
+import time
+
+import black_jack as bj
+
+
+# Prompt kinds, used as keys of the latency report.
+
+PROMPT_KINDS = {
+    bj.PROMPT_NAME: 'name',
+    bj.PROMPT_MONEY: 'money',
+    bj.PROMPT_BET: 'bet',
+    bj.PROMPT_CHOICE: 'choice',
+    bj.PROMPT_CONTINUE: 'continue',
+    bj.PROMPT_PLAY_AGAIN: 'play_again',
+}
+
+
+def null_print(*args, **kwargs):
+    pass
+
+
+class SessionScript:
+    """
+    Answers of a single scripted player.
+
+    Bets and choices ([1], [2] or '' for [ENTER]) are repeated in a cycle. Answers to the replay prompt
+    are used in order, after the last one the player always leaves the table.
+    """
+    def __init__(self, name='Player', money=1000, bets=(100,), choices=('1', ''), play_again=('', '', 'no')):
+        self.name = name
+        self.money = money
+        self.bets = bets
+        self.choices = choices
+        self.play_again = play_again
+
+    def answers(self):
+        return {
+            'name': iter([str(self.name)]),
+            'money': iter([str(self.money)]),
+            'bet': itertools.cycle([str(bet) for bet in self.bets]),
+            'choice': itertools.cycle(self.choices),
+            'continue': itertools.repeat(''),
+            'play_again': itertools.chain(self.play_again, itertools.repeat('no')),
+        }
+
+
+class ScriptedInput:
+    """
+    Replacement for input() which answers prompts from a SessionScript.
+
+    Latency of a prompt is the time from the previous answer (or from the start of the session)
+    until the game asks this prompt.
+    """
+    def __init__(self, script, latencies, clock=time.perf_counter):
+        self.answers = script.answers()
+        self.latencies = latencies
+        self.clock = clock
+        self.prompts = 0
+        self.last_answer_time = clock()
+
+    def __call__(self, prompt=''):
+        now = self.clock()
+        try:
+            kind = PROMPT_KINDS[prompt]
+        except KeyError:
+            raise ValueError(f'Unexpected prompt: {prompt!r}')
+
+        self.latencies.setdefault(kind, []).append(now - self.last_answer_time)
+        self.prompts += 1
+        answer = next(self.answers[kind])
+        self.last_answer_time = self.clock()
+        return answer
+
+
+class LoadReport:
+    def __init__(self, sessions, prompts, elapsed, latencies):
+        self.sessions = sessions
+        self.prompts = prompts
+        self.elapsed = elapsed
+        self.latencies = latencies
+
+    def sessions_per_second(self):
+        return self.sessions / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def prompts_per_second(self):
+        return self.prompts / self.elapsed if self.elapsed > 0 else float('inf')
+
+    @staticmethod
+    def percentile(values, percent):
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return ordered[index]
+
+    def __str__(self):
+        lines = [f'Sessions: {self.sessions}, prompts: {self.prompts}, time: {self.elapsed:.3f} s',
+                 f'Throughput: {self.sessions_per_second():.1f} sessions/s, {self.prompts_per_second():.1f} prompts/s',
+                 '',
+                 '{:12} {:>9} {:>10} {:>10} {:>10} {:>10}'.format('prompt', 'count', 'mean, ms', 'p50, ms',
+                                                                  'p95, ms', 'max, ms')]
+        for kind in PROMPT_KINDS.values():
+            values = self.latencies.get(kind)
+            if not values:
+                continue
+            lines.append('{:12} {:>9} {:>10.4f} {:>10.4f} {:>10.4f} {:>10.4f}'.format(
+                kind, len(values), sum(values) / len(values) * 1000, self.percentile(values, 50) * 1000,
+                self.percentile(values, 95) * 1000, max(values) * 1000))
+        return '\n'.join(lines)
+
+
+def run_load_test(sessions=1000, script=None, seed=None, print_func=null_print):
+    if script is None:
+        script = SessionScript()
+    if seed is not None:
+        random.seed(seed)
+
+    latencies = {}
+    prompts = 0
+    start = time.perf_counter()
+    for _ in range(sessions):
+        scripted_input = ScriptedInput(script, latencies)
+        bj.main(input_func=scripted_input, print_func=print_func)
+        prompts += scripted_input.prompts
+    elapsed = time.perf_counter() - start
+
+    return LoadReport(sessions, prompts, elapsed, latencies)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run scripted sessions through the Black Jack console interface.')
+    parser.add_argument('--sessions', type=int, default=1000, help='number of complete game sessions')
+    parser.add_argument('--money', type=int, default=1000, help='cash of the scripted player')
+    parser.add_argument('--bet', type=int, action='append', help='bet of the scripted player, may be repeated')
+    parser.add_argument('--choice', action='append', help="answer to the move prompt: 1, 2 or '' for [ENTER]")
+    parser.add_argument('--rounds', type=int, default=3, help='rounds the player wants to play in each session')
+    parser.add_argument('--seed', type=int, help='seed for the random generator')
+    args = parser.parse_args()
+
+    script = SessionScript(money=args.money,
+                           bets=args.bet or (100,),
+                           choices=args.choice or ('1', ''),
+                           play_again=('',) * (args.rounds - 1))
+    print(run_load_test(sessions=args.sessions, script=script, seed=args.seed))
@@ -0,0 +1,255 @@
+"""
+Monte Carlo simulation of Black Jack rounds.
+
+Estimates the player's expected return per unit bet for a given strategy. Instead of a fixed number
+of rounds, a simulation may be given a target precision: it then checks the confidence interval of
+the estimate every check_every rounds and stops as soon as the interval is narrow enough.
+
+Usage:
+    python -m black_jack.simulation --precision 0.005 --confidence 0.95 --workers 4
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+import black_jack as bj
+
+
+DEFAULT_ROUNDS = 100_000    # Number of rounds when no precision is requested.
+MAX_ROUNDS = 10_000_000     # Upper limit of rounds when a precision is requested.
+CHECK_EVERY = 10_000        # Rounds between two checks of the confidence interval.
+
+
+# Strategies get the value of the player's hand and the value of the dealer's open card
+# and answer like a player in the console: [1], [2] or '' for [ENTER].
+
+def dealer_strategy(player_value, dealer_card_value):
+    return '1' if player_value < 17 else ''
+
+
+def basic_strategy(player_value, dealer_card_value):
+    # Simplified basic strategy: the game has no splits and no soft hands distinction.
+    if player_value in (10, 11) and dealer_card_value < 10:
+        return '2'
+    if player_value <= 11:
+        return '1'
+    if player_value <= 16 and dealer_card_value >= 7:
+        return '1'
+    if player_value == 12 and dealer_card_value <= 3:
+        return '1'
+    return ''
+
+
+class RunningStats:
+    """
+    Online mean and variance (Welford's algorithm).
+
+    Statistics collected separately, e.g. by parallel workers, are combined with merge().
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    def variance(self):
+        if self.count < 2:
+            return float('inf')
+        return self.m2 / (self.count - 1)
+
+    def half_width(self, confidence):
+        """
+        Half-width of the normal confidence interval for the mean.
+        """
+        z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * math.sqrt(self.variance() / self.count) if self.count > 1 else float('inf')
+
+
+class SimulationResult:
+    def __init__(self, stats, confidence, precision):
+        self.stats = stats
+        self.confidence = confidence
+        self.precision = precision
+
+    @property
+    def rounds(self):
+        return self.stats.count
+
+    @property
+    def expected_return(self):
+        return self.stats.mean
+
+    @property
+    def half_width(self):
+        return self.stats.half_width(self.confidence)
+
+    @property
+    def precision_reached(self):
+        return self.precision is not None and self.half_width <= self.precision
+
+    def __str__(self):
+        text = (f'Rounds: {self.rounds}\n'
+                f'Expected return per unit bet: {self.expected_return:+.5f} '
+                f'± {self.half_width:.5f} ({self.confidence:.0%} confidence)')
+        if self.precision is not None:
+            text += '\nTarget precision ' + ('reached.' if self.precision_reached else 'NOT reached.')
+        return text
+
+
+def play_round(strategy=dealer_strategy, bet=1):
+    """
+    Play one round by the rules of the console game and return the player's win or loss per unit bet.
+    """
+    player = bj.Player('Player', bet * 2)
+    dealer = bj.Player('Dealer', bet * 2)
+    table = bj.GameTable(dealer, player)
+    deck = bj.Deck(deck_type=52)
+    table.make_a_bet(bet)
+
+    for i in range(2):
+        player.hand.take_card(deck.get_card())
+        player.hand.open_card()
+
+    for i in range(2):
+        dealer.hand.take_card(deck.get_card())
+        if i == 0:
+            dealer.hand.open_card()
+
+    dealer_card_value = dealer.hand.cards[0].get_value()
+    while player.hand.count_values() <= 21:
+        choice = strategy(player.hand.count_values(), dealer_card_value)
+        if choice in ['1', '2']:
+            player.hand.take_card(deck.get_card())
+            player.hand.open_card()
+
+            if choice == '2':
+                try:
+                    table.make_a_bet(int(table.bank / 2))
+                except ValueError:
+                    pass
+        else:
+            break
+
+    if player.hand.count_values() <= 21:
+        dealer.hand.open_card()
+        while dealer.hand.count_values() < 17:
+            dealer.hand.take_card(deck.get_card())
+            dealer.hand.open_card()
+
+    table.check_game_status()
+    table.reward_winner()
+    return (player.money - bet * 2) / bet
+
+
+def run_batch(rounds, strategy=dealer_strategy, seed=None):
+    if seed is not None:
+        random.seed(seed)
+
+    stats = RunningStats()
+    for _ in range(rounds):
+        stats.push(play_round(strategy))
+    return stats
+
+
+def _check_arguments(rounds, precision, confidence, check_every):
+    if not 0 < confidence < 1:
+        raise ValueError(f'Confidence level must be between 0 and 1, got {confidence}.')
+    if precision is not None and precision <= 0:
+        raise ValueError(f'Precision must be positive, got {precision}.')
+    if check_every <= 0:
+        raise ValueError(f'check_every must be positive, got {check_every}.')
+    if rounds is None:
+        rounds = DEFAULT_ROUNDS if precision is None else MAX_ROUNDS
+    if rounds <= 0:
+        raise ValueError(f'Number of rounds must be positive, got {rounds}.')
+    return rounds
+
+
+def _run_until_precise(run_step, rounds, precision, confidence, check_every):
+    """
+    Collect statistics step by step and stop after `rounds` rounds or as soon as the merged
+    statistics give a confidence interval not wider than ± precision.
+    """
+    stats = RunningStats()
+    while stats.count < rounds:
+        for batch_stats in run_step(min(check_every, rounds - stats.count)):
+            stats.merge(batch_stats)
+        if precision is not None and stats.half_width(confidence) <= precision:
+            break
+    return SimulationResult(stats, confidence, precision)
+
+
+def simulate(rounds=None, precision=None, confidence=0.95, strategy=dealer_strategy, check_every=CHECK_EVERY,
+             seed=None):
+    """
+    Run the simulation in the current process.
+
+    Without precision exactly `rounds` rounds are played. With precision `rounds` is the upper limit.
+    """
+    rounds = _check_arguments(rounds, precision, confidence, check_every)
+    if seed is not None:
+        random.seed(seed)
+
+    def run_step(step_rounds):
+        return [run_batch(step_rounds, strategy)]
+
+    return _run_until_precise(run_step, rounds, precision, confidence, check_every)
+
+
+def simulate_parallel(rounds=None, precision=None, confidence=0.95, strategy=dealer_strategy,
+                      check_every=CHECK_EVERY, seed=None, workers=None):
+    """
+    Run the simulation in several processes.
+
+    Every check_every rounds are split between the workers, their statistics are merged
+    and the stopping decision is made on the merged statistics.
+    """
+    rounds = _check_arguments(rounds, precision, confidence, check_every)
+    workers = workers or os.cpu_count() or 1
+    seeds = random.Random(seed)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def run_step(step_rounds):
+            sizes = [step_rounds // workers + (1 if i < step_rounds % workers else 0) for i in range(workers)]
+            futures = [executor.submit(run_batch, size, strategy, seeds.getrandbits(64)) for size in sizes if size]
+            return [future.result() for future in futures]
+
+        return _run_until_precise(run_step, rounds, precision, confidence, check_every)
+
+
+if __name__ == '__main__':
+    strategies = {'dealer': dealer_strategy, 'basic': basic_strategy}
+
+    parser = argparse.ArgumentParser(description="Estimate the player's expected return per unit bet.")
+    parser.add_argument('--rounds', type=int, help='number of rounds, or the upper limit if --precision is given')
+    parser.add_argument('--precision', type=float, help='target half-width of the confidence interval')
+    parser.add_argument('--confidence', type=float, default=0.95, help='confidence level of the interval')
+    parser.add_argument('--check-every', type=int, default=CHECK_EVERY, help='rounds between interval checks')
+    parser.add_argument('--strategy', choices=strategies, default='dealer', help="player's strategy")
+    parser.add_argument('--workers', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--seed', type=int, help='seed for the random generator')
+    args = parser.parse_args()
+
+    options = dict(rounds=args.rounds, precision=args.precision, confidence=args.confidence,
+                   strategy=strategies[args.strategy], check_every=args.check_every, seed=args.seed)
+    if args.workers > 1:
+        print(simulate_parallel(workers=args.workers, **options))
+    else:
+        print(simulate(**options))
@@ -1,5 +1,14 @@
+import os
+import subprocess
+import sys
 import unittest
 import black_jack as bj
+from black_jack import load_harness, simulation
+
+
+# Time budget of `import black_jack` plus creation of the first game table, seconds.
+
+STARTUP_BUDGET = 0.25
 
 
 class TestBlackJackBasics(unittest.TestCase):
@@ -136,6 +145,20 @@ class TestBlackJackGame(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.table.reward_winner()
 
+    def test_game_table_check_game_status(self):
+        cases = [(('10', 'King', '2'), ('5',), bj.DEALER_WINS), (('10', '9'), ('10', '5', '8'), bj.PLAYER_WINS),
+                 (('10', '9'), ('Queen', '9'), bj.DRAW), (('10', '7'), ('Ace', '9'), bj.DEALER_WINS)]
+        for player_ranks, dealer_ranks, status in cases:
+            with self.subTest(player=player_ranks, dealer=dealer_ranks):
+                self.table.player.reset_hand()
+                self.table.dealer.reset_hand()
+                for player, ranks in [(self.table.player, player_ranks), (self.table.dealer, dealer_ranks)]:
+                    for rank in ranks:
+                        player.hand.take_card(bj.Card(bj.global_card_suits[0], rank))
+                        player.hand.open_card()
+                self.assertEqual(self.table.check_game_status(), status)
+                self.assertEqual(self.table.game_status, status)
+
     def test_game_taking_a_card(self):
         card = self.deck.get_card()
         self.table.player.hand.take_card(card)
@@ -304,5 +327,134 @@ class TestBlackJackGame(unittest.TestCase):
             self.assertEqual(self.table.player.hand.count_values(), 16)
 
 
+class TestBlackJackCli(unittest.TestCase):
+    """
+    This group of tests drive the console interface with scripted answers.
+    """
+    def test_main_without_money(self):
+        answers = iter(['Player', '0'])
+        output = []
+        bj.main(input_func=lambda prompt='': next(answers), print_func=output.append)
+        with self.subTest('all answers used'):
+            self.assertIsNone(next(answers, None))
+        with self.subTest('player is shown the door'):
+            self.assertIn('дверь', output[-1])
+
+    def test_main_refuses_too_big_bets(self):
+        script = load_harness.SessionScript(money=100, bets=(101,))
+        latencies = {}
+        bj.main(input_func=load_harness.ScriptedInput(script, latencies), print_func=load_harness.null_print)
+        self.assertEqual(len(latencies['bet']), 3)
+
+    def test_load_test_runs_sessions(self):
+        script = load_harness.SessionScript(money=1000, bets=(10,), choices=('2', ''), play_again=('',))
+        report = load_harness.run_load_test(sessions=20, script=script, seed=1)
+        with self.subTest('sessions'):
+            self.assertEqual(report.sessions, 20)
+        with self.subTest('one name prompt per session'):
+            self.assertEqual(len(report.latencies['name']), 20)
+        with self.subTest('two rounds per session'):
+            self.assertEqual(len(report.latencies['bet']), 40)
+        with self.subTest('prompts'):
+            self.assertEqual(report.prompts, sum(len(values) for values in report.latencies.values()))
+
+    def test_scripted_input_unexpected_prompt(self):
+        scripted_input = load_harness.ScriptedInput(load_harness.SessionScript(), {})
+        with self.assertRaises(ValueError):
+            scripted_input('Unknown prompt? ')
+
+
+class TestSimulation(unittest.TestCase):
+    """
+    This group of tests check the simulation runners and their early stopping.
+    """
+    def test_running_stats_merge(self):
+        values = [1, -1, -1, 2, 0, 1, -2, -1]
+        whole, first, second = simulation.RunningStats(), simulation.RunningStats(), simulation.RunningStats()
+        for value in values:
+            whole.push(value)
+        for value in values[:3]:
+            first.push(value)
+        for value in values[3:]:
+            second.push(value)
+        first.merge(second)
+        with self.subTest('count'):
+            self.assertEqual(first.count, whole.count)
+        with self.subTest('mean'):
+            self.assertAlmostEqual(first.mean, whole.mean)
+        with self.subTest('variance'):
+            self.assertAlmostEqual(first.variance(), whole.variance())
+
+    def test_play_round_result(self):
+        for _ in range(200):
+            self.assertIn(simulation.play_round(simulation.basic_strategy), (-2, -1, 0, 1, 2))
+
+    def test_simulate_fixed_rounds(self):
+        result = simulation.simulate(rounds=1500, check_every=1000, seed=1)
+        with self.subTest('rounds'):
+            self.assertEqual(result.rounds, 1500)
+        with self.subTest('precision'):
+            self.assertFalse(result.precision_reached)
+
+    def test_simulate_stops_early(self):
+        result = simulation.simulate(rounds=100_000, precision=0.1, confidence=0.9, check_every=500, seed=1)
+        with self.subTest('precision reached'):
+            self.assertTrue(result.precision_reached)
+        with self.subTest('rounds used'):
+            self.assertLess(result.rounds, 100_000)
+        with self.subTest('checked every 500 rounds'):
+            self.assertEqual(result.rounds % 500, 0)
+
+    def test_simulate_parallel_stops_early(self):
+        result = simulation.simulate_parallel(rounds=100_000, precision=0.1, check_every=501, seed=1, workers=2)
+        with self.subTest('precision reached'):
+            self.assertTrue(result.precision_reached)
+        with self.subTest('checked every 501 rounds'):
+            self.assertEqual(result.rounds % 501, 0)
+
+    def test_simulate_wrong_confidence(self):
+        with self.assertRaises(ValueError):
+            simulation.simulate(precision=0.01, confidence=1.5)
+
+
+class TestStartup(unittest.TestCase):
+    """
+    This group of tests keep the package fast to import: heavy subsystems must be loaded lazily.
+    """
+    startup_code = (
+        'import sys, time\n'
+        'start = time.perf_counter()\n'
+        'import black_jack as bj\n'
+        "bj.GameTable(bj.Player('Dealer', 5000), bj.Player('Player', 1000))\n"
+        'print(time.perf_counter() - start)\n'
+        "print(' '.join(sys.modules))\n"
+    )
+
+    def run_startup(self):
+        result = subprocess.run([sys.executable, '-c', self.startup_code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        elapsed, modules = result.stdout.splitlines()
+        return float(elapsed), modules.split()
+
+    def test_startup_time(self):
+        elapsed = min(self.run_startup()[0] for _ in range(3))
+        self.assertLess(elapsed, STARTUP_BUDGET)
+
+    def test_heavy_modules_not_imported(self):
+        modules = self.run_startup()[1]
+        for module in ['black_jack.simulation', 'black_jack.load_harness', 'concurrent.futures', 'argparse']:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+    def test_lazy_attributes(self):
+        with self.subTest('submodule'):
+            self.assertIs(bj.simulation, simulation)
+        with self.subTest('function'):
+            self.assertIs(bj.run_load_test, load_harness.run_load_test)
+        with self.subTest('unknown attribute'):
+            with self.assertRaises(AttributeError):
+                bj.no_such_attribute
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file